@@ -323,10 +323,10 @@ class LucasKanade(IDIMethod):
         """Set the reference image.
         """
         if type(reference_image) == int:
-            ref = video.mraw[reference_image].copy().astype(float)
+            ref = video.mraw[reference_image].astype(float)
         elif type(reference_image) == tuple:
             if len(reference_image) == 2:
-                ref = np.mean(video.mraw[reference_image[0]:reference_image[1]].copy().astype(float), axis=0)
+                ref = np.mean(video.mraw[reference_image[0]:reference_image[1]], axis=0, dtype=float)
         elif type(reference_image) == np.ndarray:
             ref = reference_image
         else:
@@ -500,7 +500,7 @@ class LucasKanade(IDIMethod):
         shape = tuple([int(_) for _ in log[4].replace(' ', '').split(':')[1].replace('(', '').replace(')', '').split(',')])
  
         self.temp_disp = np.memmap(self.disp_filename, dtype=np.float, mode='r+', shape=shape)
-        self.displacements = np.array(self.temp_disp).copy()
+        self.displacements = np.array(self.temp_disp)
 
         self.start_time = int(log[-1].replace(' ', '').rstrip().split('\t')[1].split(':')[1]) + 1
         self.analysis_run = int(log[-1].split('<')[1].split('>')[0]) + 1
@@ -3,7 +3,6 @@ import numpy as np
 import collections
 import matplotlib.pyplot as plt
 import pickle
-import pyMRAW
 import datetime
 
 from .methods import IDIMethod, SimplifiedOpticalFlow, GradientBasedOpticalFlow, LucasKanadeSc, LucasKanade
@@ -47,6 +46,7 @@ class pyIDI:
 
         if type(cih_file) == str:
             # Load selected video
+            import pyMRAW
             self.mraw, self.info = pyMRAW.load_video(self.cih_file)
             self.N = self.info['Total Frame']
             self.image_width = self.info['Image Width']
@@ -63,6 +63,16 @@ class pyIDI:
             raise ValueError('`cih_file` must be either a cih filename or a 3D array (N_time, height, width)')
 
 
+    def __getitem__(self, key):
+        """
+        Index the video frames directly, e.g. `video[10:20]`.
+
+        Basic slices return views of the underlying memmap, so no data is
+        copied until it is used.
+        """
+        return self.mraw[key]
+
+
     def set_method(self, method, **kwargs):
         """
         Set displacement identification method on video.
@@ -157,6 +167,23 @@ class pyIDI:
             plt.arrow(ind[1], ind[0], scale*f1, scale*f0, width=width, color='r', alpha=alpha)
 
 
+    def time_series(self, points):
+        """
+        Get the intensity time history of selected pixels.
+
+        The pixels are gathered from the video in a single fancy-indexing
+        call and returned point-major, so that each row is a contiguous
+        time series.
+
+        :param points: pixel locations (number_of_points, 2), as (y, x)
+        :type points: array_like
+        :return: intensity time series (number_of_points, N)
+        :rtype: ndarray
+        """
+        points = np.asarray(points, dtype=int).reshape(-1, 2)
+        return np.ascontiguousarray(self.mraw[:, points[:, 0], points[:, 1]].T)
+
+
     def get_displacements(self, **kwargs):
         """
         Calculate the displacements based on chosen method.
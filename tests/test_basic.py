@@ -28,6 +28,21 @@ def test_info():
     assert 'Total Frame' in video.info.keys()
     assert 'Record Rate(fps)' in video.info.keys()
 
+def test_time_series():
+    video = pyidi.pyIDI(cih_file='./data/data_showcase.cih')
+    points = np.array([(0, 1), (5, 3)])
+    ts = video.time_series(points)
+    assert ts.shape == (2, video.N)
+    assert ts.flags['C_CONTIGUOUS']
+    np.testing.assert_array_equal(ts[1], video.mraw[:, 5, 3])
+
+def test_getitem():
+    video = pyidi.pyIDI(cih_file='./data/data_showcase.cih')
+    frames = video[2:5]
+    assert frames.shape == (3, video.image_height, video.image_width)
+    assert np.shares_memory(frames, video.mraw)
+    np.testing.assert_array_equal(video[0], video.mraw[0])
+
 
 if __name__ == '__main__':
     test_info()